@@ -22,20 +22,26 @@
 
 
 import configparser
+import functools
+import hashlib
 import json
 import os
 import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import requests
 import typer
 
-import ollama
-
 from rich import print
 from rich.console import Console
-from rich.panel import Panel
+
+# orjson is optional; it raises a subclass of json.JSONDecodeError.
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 
 app = typer.Typer(
@@ -45,7 +51,38 @@ app = typer.Typer(
 
 console = Console()
 
+# Pre-compiled patterns used to parse git config and LLM output.
+_JSON_BLOCK_RE = re.compile(r"```json\s*({.*?})\s*```", re.DOTALL)
+_JSON_BLOCK_RE_NL = re.compile(r"```json\n(.*?)```", re.DOTALL)
+_GIT_URL_RE = re.compile(
+    r"(?:https://github\.com/|git@github\.com:)([^/]+)/([^.]+)(\.git)?"
+)
+
+# Folders left out of the tree sent to the LLM.
+IGNORE_DIRS = (".git", "node_modules", ".venv", "venv", "__pycache__",
+               ".mypy_cache", ".pytest_cache", "dist", "build", "target",
+               ".tox", ".idea", ".vscode")
+
+# Default character limits for each part of the prompt.
+MAX_README_CHARS = 16000
+MAX_TREE_CHARS = 4000
+MAX_GIT_CONFIG_CHARS = 1000
+
+# Indentation for each tree depth, built once.
+_INDENTS = tuple("    " * i for i in range(64))
+
+CACHE_DIR = Path("~/.cache/readme_consultant").expanduser()
+GH_ETAG_CACHE = CACHE_DIR / "gh_etag.json"
+
+# Shared so repeated GitHub API calls reuse the same connection. Created on
+# first use to keep 'requests' out of CLI startup.
+_session = None
+
+# Epoch time until which the GitHub API should not be queried.
+_rate_limit_reset = 0.0
+
 
+@functools.lru_cache(maxsize=128)
 def get_readme_contents(repo_dir):
     """Returns contents of a README.md or None otherwise.
 
@@ -78,6 +115,20 @@ def get_owner_and_repo_from_git_config(repo_dir):
     config = configparser.ConfigParser()
     config.read(config_path)
 
+    return _extract_owner_repo(config)
+
+
+def _extract_owner_repo(config):
+    """Returns 'owner' and 'repo_name' from a parsed git config.
+
+    Args:
+        config (configparser.ConfigParser): parsed .git/config.
+
+    Returns:
+        owner(str): name of owner. 'None' if not found.
+        repo(str): name of repo. 'None' if not found.
+    """
+
     try:
         url = config['remote "origin"']['url']
     except KeyError:
@@ -85,7 +136,7 @@ def get_owner_and_repo_from_git_config(repo_dir):
         return None, None
 
     # Match both HTTPS and SSH GitHub URLs
-    match = re.match(r"(?:https://github\.com/|git@github\.com:)([^/]+)/([^.]+)(\.git)?", url)
+    match = _GIT_URL_RE.match(url)
     if match:
         owner, repo = match.group(1), match.group(2)
         return owner, repo
@@ -94,9 +145,63 @@ def get_owner_and_repo_from_git_config(repo_dir):
         return None, None
 
 
+def _load_git_config(repo_dir):
+    """Reads .git/config once and returns its contents with owner and repo.
+
+    Args:
+        repo_dir (str): location of repo.
+
+    Returns:
+        str: contents of .git/config.
+        owner(str): name of owner. 'None' if not found.
+        repo(str): name of repo. 'None' if not found.
+    """
+
+    text = get_git_config(repo_dir)
+    config = configparser.ConfigParser()
+    config.read_string(text)
+    owner, repo = _extract_owner_repo(config)
+    return text, owner, repo
+
+
+def _load_etag_cache() -> dict:
+    """Returns the saved {url: [etag, tag_name]} map for GitHub requests."""
+
+    try:
+        cache = json.loads(read_text(GH_ETAG_CACHE))
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(cache, dict):
+        return {}
+    return cache
+
+
+def _save_etag_cache(cache: dict):
+    """Saves the {url: [etag, tag_name]} map. Failures are ignored."""
+
+    _write_cache_file(GH_ETAG_CACHE, json.dumps(cache))
+
+
+def _get_session():
+    """Returns the shared requests.Session for the GitHub API."""
+
+    global _session
+
+    if _session is None:
+        import requests
+
+        _session = requests.Session()
+        _session.headers.update({"Accept": "application/vnd.github+json"})
+    return _session
+
+
 def get_latest_release_tag_using_internal(owner: str, repo: str) -> str:
     """Get the latest tag using github api.
 
+    Uses a conditional request so an unchanged release costs no download and
+    doesn't count against the rate limit.
+
     Args:
         owner (str): Name of owner.
         repo (str): Name of repo.
@@ -105,19 +210,42 @@ def get_latest_release_tag_using_internal(owner: str, repo: str) -> str:
         str: Latest release version tag. E.g. "v1.0.1"
     """
 
-    url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
-    response = requests.get(url)
+    global _rate_limit_reset
 
-    if response.status_code == 200:
-        data = response.json()
-        return data.get("tag_name")
+    url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
+    cache = _load_etag_cache()
+    entry = cache.get(url)
+    if isinstance(entry, list) and len(entry) == 2:
+        etag, cached_tag = entry
+    else:
+        etag, cached_tag = None, None
+
+    if time.time() < _rate_limit_reset:
+        print("GitHub API rate limit reached, using cached release.")
+        return cached_tag
+
+    headers = {"If-None-Match": etag} if etag else {}
+    response = _get_session().get(url, headers=headers)
+
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        _rate_limit_reset = float(
+            response.headers.get("X-RateLimit-Reset", time.time() + 60))
+
+    if response.status_code == 304:
+        return cached_tag
+    elif response.status_code == 200:
+        tag_name = response.json().get("tag_name")
+        if "ETag" in response.headers:
+            cache[url] = [response.headers["ETag"], tag_name]
+            _save_etag_cache(cache)
+        return tag_name
     elif response.status_code == 404:
         print("No releases found — this repo may" +
               " use tags without GitHub releases.")
         return None
     else:
         print(f"Error fetching release: {response.status_code}")
-        return None
+        return cached_tag
 
 
 def read_text(filepath):
@@ -130,10 +258,39 @@ def read_text(filepath):
         str: Contents of file.
     """
 
-    with open(filepath, 'r', encoding='utf-8') as f:
+    with open(filepath, 'r', encoding='utf-8', buffering=1 << 20) as f:
         return f.read()
 
 
+def write_text(filepath, data):
+    """Writes data to filepath as UTF-8.
+
+    Args:
+        filepath (str): Path to file to write.
+        data (str): Contents to write.
+    """
+
+    with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(data)
+
+
+def _write_cache_file(path: Path, data: str):
+    """Atomically writes data to a file in the cache. Failures are ignored.
+
+    Args:
+        path (Path): Destination inside CACHE_DIR.
+        data (str): Contents to write.
+    """
+
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        write_text(tmp_path, data)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
 def get_git_config(repo_dir):
     """Returns content of .git/config from repo.
 
@@ -147,64 +304,144 @@ def get_git_config(repo_dir):
     return read_text(os.path.join(repo_dir, ".git", "config"))
 
 
-def get_folder_structure(path: str, max_depth: int = None,
-                         ignore_dirs=[".git"]) -> str:
+def get_folder_structure(path: str, max_depth: int = 4,
+                         ignore_dirs=IGNORE_DIRS) -> str:
     """Walks the folder structure and returns its tree as a string.
 
     The output is similar to the 'tree' tool.
 
     Args:
         path (str): Folderpath to traverse.
-        max_depth (int, optional): Maximum level to recurse. Defaults to None.
-        ignore_dirs (str, optional): Folders to ignore. Defaults to None.
+        max_depth (int, optional): Maximum level to recurse. None for no
+                                   limit. Defaults to 4.
+        ignore_dirs (tuple, optional): Folders to ignore. Defaults to
+                                       IGNORE_DIRS.
 
     Returns:
         str: _description_
     """
-    base = Path(path).resolve()
     ignore_dirs = set(ignore_dirs)
     tree_output = ["."]
-
-    for entry in sorted(base.rglob("*")):
-        if any(part in ignore_dirs for part in entry.parts):
+    if max_depth is not None and max_depth < 1:
+        return "".join(tree_output)
+
+    def scan(dirpath):
+        try:
+            with os.scandir(dirpath) as it:
+                return sorted((e for e in it
+                               if e.name not in ignore_dirs
+                               or not e.is_dir(follow_symlinks=False)),
+                              key=lambda e: e.name)
+        except OSError:
+            return []
+
+    # Iterative pre-order walk; ignored folders are pruned before descending.
+    stack = [(entry, 0) for entry in reversed(scan(path))]
+    while stack:
+        entry, depth = stack.pop()
+        indent = (_INDENTS[depth] if depth < len(_INDENTS)
+                  else "    " * depth)
+        tree_output.extend(("\n", indent, "└── ", entry.name))
+
+        if max_depth is not None and depth + 2 > max_depth:
             continue
+        if entry.is_dir(follow_symlinks=False):
+            stack.extend((child, depth + 1)
+                         for child in reversed(scan(entry.path)))
+
+    return "".join(tree_output)
+
+
+def _llm_cache_key(prompt: str, model: str) -> str:
+    """Returns the cache key for a prompt sent to a given model."""
+
+    return hashlib.sha256((model + "\0" + prompt).encode("utf-8")).hexdigest()
+
+
+def _llm_cache_get(key: str):
+    """Returns a cached LLM response or None if there isn't one."""
+
+    try:
+        return read_text(CACHE_DIR / key)
+    except OSError:
+        return None
 
-        rel_path = entry.relative_to(base)
-        depth = len(rel_path.parts)
-        if max_depth is not None and depth > max_depth:
-            continue
-        indent = "    " * (depth - 1)
-        tree_output.append(f"{indent}└── {rel_path.name}")
 
-    return "\n".join(tree_output)
+def _llm_cache_put(key: str, value: str):
+    """Saves an LLM response to the cache. Failures are ignored."""
 
+    _write_cache_file(CACHE_DIR / key, value)
 
-def send_prompt_to_LLM(prompt: str, model: str = "llama3") -> str:
+
+def send_prompt_to_LLM(prompt: str, model: str = "llama3",
+                       use_cache: bool = True, refresh: bool = False,
+                       stop_when=None) -> str:
     """Sends prompt to specified LLM and returns output.
 
+    Responses are cached on disk so the same prompt isn't sent twice. The
+    response is streamed so generation can be cut short once the caller has
+    what it needs.
+
     Args:
         prompt (str): Block of text containg prompt.
         model (str, optional): Name of model. Defaults to "llama3".
+        use_cache (bool, optional): Read and write the response cache.
+                                    Defaults to True.
+        refresh (bool, optional): Ignore any cached response but still save
+                                  the new one. Defaults to False.
+        stop_when (callable, optional): Called with the text received so far
+                                        whenever a code fence may have closed.
+                                        Streaming stops once it returns True.
+                                        Defaults to None.
 
     Returns:
         str: response from LLM.
     """
 
-    with console.status("[bold green]Analyzing your README with LLM...[/]"):
-        response = ollama.chat(
+    key = _llm_cache_key(prompt, model)
+    if use_cache and not refresh:
+        cached = _llm_cache_get(key)
+        if cached is not None:
+            return cached
+
+    import ollama
+
+    parts = []
+    received = 0
+    message = "[bold green]Analyzing your README with LLM...[/]"
+    with console.status(message) as status:
+        stream = ollama.chat(
             model=model,
             messages=[
                 {"role": "user", "content": prompt}
-            ]
+            ],
+            stream=True
         )
-    return response['message']['content']
+        try:
+            for chunk in stream:
+                piece = chunk['message']['content']
+                parts.append(piece)
+                received += len(piece)
+                status.update(f"{message} ({received} chars received)")
+
+                if (stop_when is not None and "`" in piece
+                        and stop_when("".join(parts))):
+                    break
+        finally:
+            # Closing the stream drops the connection and ends generation.
+            if hasattr(stream, "close"):
+                stream.close()
+    content = "".join(parts)
+
+    if use_cache:
+        _llm_cache_put(key, content)
+    return content
 
 
 def extract_json_block(text: str) -> dict:
     """Extracts last JSON code block from a string and returns it as a dict."""
 
-    pattern = r"```json\s*({.*?})\s*```"
-    match = re.search(pattern, text, re.DOTALL)
+    match = _JSON_BLOCK_RE.search(text)
 
     if not match:
         raise ValueError("No valid JSON block found in the input.")
@@ -212,11 +449,12 @@ def extract_json_block(text: str) -> dict:
     json_str = match.group(1)
 
     try:
-        return json.loads(json_str)
+        return _loads(json_str)
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON content: {e}")
 
 
+@functools.lru_cache(maxsize=128)
 def get_real_path(filepath: str) -> str:
     """Return real path from a given path
 
@@ -226,41 +464,99 @@ def get_real_path(filepath: str) -> str:
     Returns:
         str: Real filepath.
     """
-    return str(Path(filepath).resolve())
+    return os.path.abspath(filepath)
+
 
+def _find_markdown_block(text: str):
+    """Finds the first markdown code block with plain string searches.
 
-def extract_markdown_block(text: str) -> str:
+    Args:
+        text (str): output from LLM.
+
+    Returns:
+        str: Contents of the block. 'None' if not found.
+        int: Index just past the closing fence. 0 if not found.
     """
-    Extracts the first markdown code block from a string.
 
-    Returns the markdown code as a string.
+    start_tag = "```markdown\n"
+    start = text.find(start_tag)
+    if start < 0:
+        return None, 0
+
+    start += len(start_tag)
+    end = text.find("```", start)
+    if end < 0:
+        return None, 0
+    return text[start:end], end + 3
+
+
+def _extract_changes_made(text: str, pos: int = 0):
+    """Returns "changes_made" from the last json block at or after pos.
+
+    Args:
+        text (str): output from LLM.
+        pos (int, optional): Index to start searching from. Defaults to 0.
+
+    Returns:
+        list: Changes made by LLM. 'None' if the block is missing, invalid
+              or has no "changes_made" key.
     """
-    pattern = r"```markdown\n(.*?)```"
-    match = re.search(pattern, text, re.DOTALL)
-    return match.group(1).strip() if match else ""
 
+    last = None
+    for match in _JSON_BLOCK_RE_NL.finditer(text, pos):
+        last = match
 
-def extract_changes_made_block(text: str) -> list:
-    """Extracts changes made by the LLM as a list.
+    if last is None:
+        return None
+
+    try:
+        data = _loads(last.group(1).strip())
+    except json.JSONDecodeError:
+        return None
+
+    if not isinstance(data, dict) or "changes_made" not in data:
+        return None
+    return data["changes_made"]
+
+
+def _parse_llm_response(text: str):
+    """Extracts the README and changes made from LLM output in one pass.
 
     Args:
         text (str): output from LLM.
 
     Returns:
-        bool: True if match found otherwise false.
-        list: Changes made by LLM.
+        str: First markdown block. 'None' if not found.
+        list: Changes made by LLM from the last json block. 'None' if not
+              found or invalid.
     """
 
-    pattern = r"```json\n(.*?)```"
-    matches = re.findall(pattern, text, re.DOTALL)
+    markdown, end = _find_markdown_block(text)
+    if markdown is not None:
+        markdown = markdown.strip()
+
+    # The json block follows the README, so only search past it.
+    return markdown, _extract_changes_made(text, end)
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    """Shortens text to about max_chars, keeping its start and end.
 
-    if len(matches) == 0:
-        return False, []
-    block = matches[-1].strip() if matches else ""
+    Args:
+        text (str): Text to shorten.
+        max_chars (int): Maximum characters to keep. 0 or less keeps all.
 
-    data = json.loads(block)
+    Returns:
+        str: Original text or its head and tail around a truncation marker.
+    """
 
-    return True, data['changes_made']
+    if max_chars <= 0 or len(text) <= max_chars:
+        return text
+
+    head = max_chars // 2
+    tail = max_chars - head
+    dropped = len(text) - max_chars
+    return f"{text[:head]}\n…[truncated {dropped} chars]…\n{text[-tail:]}"
 
 
 def validate_setup(repo_dir):
@@ -280,6 +576,62 @@ def validate_setup(repo_dir):
         sys.exit("ERROR: Please ensure there is a README.md in your repo.")
 
 
+def _gather_repo_context(repo_dir, max_readme_chars=MAX_README_CHARS):
+    """Validates the repo and collects everything the prompts need.
+
+    Args:
+        repo_dir (str): location of repo.
+        max_readme_chars (int, optional): Maximum README characters to keep.
+                                          Defaults to MAX_README_CHARS.
+
+    Returns:
+        dict: "tree", "readme", "git_config", "owner" and "repo".
+    """
+
+    validate_setup(repo_dir)
+
+    # These are independent file reads so run them side by side.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        f_tree = executor.submit(get_folder_structure, repo_dir)
+        f_config = executor.submit(_load_git_config, repo_dir)
+        f_readme = executor.submit(get_readme_contents, repo_dir)
+    git_config_info, owner, repo = f_config.result()
+
+    readme = f_readme.result()
+    if 0 < max_readme_chars < len(readme):
+        console.print(f"[bold yellow]WARNING: README.md has {len(readme)}"
+                      f" characters; only the first and last"
+                      f" {max_readme_chars} in total are sent to the"
+                      " LLM.[/]")
+
+    return {
+        "tree": _truncate(f_tree.result(), MAX_TREE_CHARS),
+        "readme": _truncate(readme, max_readme_chars),
+        "git_config": _truncate(git_config_info, MAX_GIT_CONFIG_CHARS),
+        "owner": owner,
+        "repo": repo,
+    }
+
+
+def _render_panel(title: str, model: str, body: str):
+    """Prints LLM output in a panel credited to the model.
+
+    Args:
+        title (str): Panel title.
+        model (str): Name of model.
+        body (str): Text to show inside the panel.
+    """
+
+    from rich.panel import Panel
+
+    console.print(Panel.fit(body,
+                            title=f"[bold cyan]{title}[/]",
+                            subtitle="[cyan]LLM Powered Improvements by"
+                                     f" \"{model}\"[/]",
+                            style="green")
+                  )
+
+
 @app.command()
 def review(repo_dir: str = typer.Option(None, "--repo-dir", "-r",
                                         help="Location of where the"
@@ -288,20 +640,23 @@ def review(repo_dir: str = typer.Option(None, "--repo-dir", "-r",
                                       help="Location of where to save"
                                            " formula file."),
            model: str = typer.Option("llama3", "--model", "-m",
-                                     help="Name of model.")
+                                     help="Name of model."),
+           no_cache: bool = typer.Option(False, "--no-cache",
+                                         help="Do not use cached LLM"
+                                              " responses."),
+           max_readme_chars: int = typer.Option(MAX_README_CHARS,
+                                                "--max-readme-chars",
+                                                help="Maximum README"
+                                                     " characters sent to"
+                                                     " the LLM. 0 for no"
+                                                     " limit.")
            ):
     """Goes through your README.md and provides feedback."""
 
-    validate_setup(repo_dir)
-
-    if ".txt" not in output:
-        output = os.path.join(output, ".txt")
+    context = _gather_repo_context(repo_dir, max_readme_chars)
 
-    # Extract information.
-    git_config_info = get_git_config(repo_dir)
-    owner, repo = get_owner_and_repo_from_git_config(repo_dir)
-    readme_file_output = get_readme_contents(repo_dir)
-    folder_tree = get_folder_structure(repo_dir)
+    if not output.endswith(".txt"):
+        output += ".txt"
 
     prompt = f"""
 You are an expert in open source documentation. You are going to review my
@@ -310,16 +665,16 @@ report to my client.
 
 The repo folder Tree:
 ----
-{folder_tree}
+{context['tree']}
 ----
 The README
 _____
-{readme_file_output}
+{context['readme']}
 _____
 
 The .git/config file looks like:
 ____
-{git_config_info}
+{context['git_config']}
 ____
 
 Please do the following:
@@ -329,22 +684,15 @@ Please do the following:
 - mention best open source practices.
 """
 
-    results = send_prompt_to_LLM(prompt, model)
+    results = send_prompt_to_LLM(prompt, model, use_cache=not no_cache)
 
-    console.print(Panel.fit(f"{results}",
-                            title="[bold cyan]Review for"
-                                  f" \"{repo}\"[/]",
-                            subtitle="[cyan]LLM Powered Improvements by"
-                                     f" \"{model}\"[/]",
-                            style="green")
-                  )
+    _render_panel(f"Review for \"{context['repo']}\"", model, results)
 
     # Start writing results to file.
     output_filepath = get_real_path(output)
-    with open(output, 'w') as f:
-        print()
-        console.print(f"[bold cyan]Output saved to:[/] {output_filepath}")
-        f.write(results)
+    write_text(output, results)
+    print()
+    console.print(f"[bold cyan]Output saved to:[/] {output_filepath}")
 
     print()
     console.print("[bold yellow]WARNING: Please double-check since"
@@ -358,20 +706,21 @@ def generate_enhanced_readme(
     output: str = typer.Option("output_readme.md", "--output", "-o",
                                help="Location of where to save"
                                     " formula file."),
-    model: str = typer.Option("llama3", "--model", "-m", help="Name of model.")
+    model: str = typer.Option("llama3", "--model", "-m", help="Name of model."),
+    no_cache: bool = typer.Option(False, "--no-cache",
+                                  help="Do not use cached LLM responses."),
+    max_readme_chars: int = typer.Option(0, "--max-readme-chars",
+                                         help="Maximum README characters"
+                                              " sent to the LLM. Anything"
+                                              " cut is missing from the"
+                                              " output. 0 for no limit.")
                              ):
     """Uses LLM to generate an improved README file."""
 
-    validate_setup(repo_dir)
-
-    if ".md" not in output:
-        output = os.path.join(output, ".md")
+    context = _gather_repo_context(repo_dir, max_readme_chars)
 
-    # Extract information.
-    git_config_info = get_git_config(repo_dir)
-    owner, repo = get_owner_and_repo_from_git_config(repo_dir)
-    readme_file_output = get_readme_contents(repo_dir)
-    folder_tree = get_folder_structure(repo_dir)
+    if not output.endswith(".md"):
+        output += ".md"
 
     prompt = f"""
 You are an expert in open source documentation.
@@ -408,48 +757,40 @@ You CANNOT forget the json block.
 
 The repo folder Tree:
 ----
-{folder_tree}
+{context['tree']}
 ----
 The README
 _____
-{readme_file_output}
+{context['readme']}
 _____
-
-The .git/config file looks like:
-____
-{git_config_info}
-____
-Do not print git config info.
 """
 
     # AI an hallucinate and act unpredictably so try multiple times.
+    # Retries skip the cache, otherwise they would get the same bad response.
     no_of_attempts = 3
     for x in range(no_of_attempts):
-        results = send_prompt_to_LLM(prompt, model)
-        readme_contents = extract_markdown_block(results)
-        got_match, changes_made = extract_changes_made_block(results)
+        results = send_prompt_to_LLM(
+            prompt, model, use_cache=not no_cache, refresh=x > 0,
+            stop_when=lambda text: None not in _parse_llm_response(text))
+        readme_contents, changes_made = _parse_llm_response(results)
 
-        if got_match:
+        if readme_contents is not None and changes_made is not None:
             break
 
-    if not got_match:
+    if changes_made is None:
         sys.exit("ERROR: Could not extract \"changes made\" from LLM.")
 
+    if readme_contents is None:
+        sys.exit("ERROR: Could not extract README from LLM.")
+
     pretty_changes = "\n".join(f"• {item}" for item in changes_made)
     print()
-    console.print(
-                  Panel.fit(f"{pretty_changes}",
-                            title="[bold cyan]Changes Made for"
-                                  f" \"{repo}\"[/]",
-                            subtitle="[cyan]LLM Powered Improvements by"
-                                     f" \"{model}\"[/]",
-                            style="green")
-                 )
+    _render_panel(f"Changes Made for \"{context['repo']}\"", model,
+                  pretty_changes)
 
     # Start writing results to file.
     output_filepath = get_real_path(output)
-    with open(output, 'w') as f:
-        f.write(readme_contents)
+    write_text(output, readme_contents)
 
     print()
     console.print("[bold yellow]WARNING: Please double-check since"